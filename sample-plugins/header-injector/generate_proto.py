@@ -1,21 +1,39 @@
 #!/usr/bin/env python3
 """Generate Python protobuf files from the plugin.proto definition."""
 
+import hashlib
 import subprocess
 import sys
 from pathlib import Path
 
+
 def main():
-    """Generate protobuf files using grpc_tools."""
+    """Generate protobuf files using grpc_tools, skipping when already up to date."""
     plugin_dir = Path(__file__).parent
     proto_dir = plugin_dir / "../../proto"
     output_dir = plugin_dir / "src/header_injector"
 
+    # Skip regeneration when the proto content has not changed since the last
+    # run, saving the protoc subprocess launch on no-op builds. A missing proto
+    # checkout falls through to the handled protoc error below.
+    proto_file = proto_dir / "plugin.proto"
+    stamp_file = output_dir / ".plugin_proto.stamp"
+    if (
+        proto_file.exists()
+        and (output_dir / "plugin_pb2.py").exists()
+        and (output_dir / "plugin_pb2.pyi").exists()
+        and stamp_file.exists()
+        and stamp_file.read_text() == hashlib.blake2b(proto_file.read_bytes()).hexdigest()
+    ):
+        print("Protobuf files up to date, skipping generation")
+        return
+
     # Generate Python protobuf files
     cmd = [
         sys.executable, "-m", "grpc_tools.protoc",
         f"--proto_path={proto_dir}",
         f"--python_out={output_dir}",
+        f"--pyi_out={output_dir}",
         f"--grpc_python_out={output_dir}",
         str(proto_dir / "plugin.proto")
     ]
@@ -27,6 +45,7 @@ def main():
         print(f"Error generating protobuf files: {result.stderr}")
         sys.exit(1)
 
+    stamp_file.write_text(hashlib.blake2b(proto_file.read_bytes()).hexdigest())
     print("Successfully generated protobuf files")
 
 if __name__ == "__main__":
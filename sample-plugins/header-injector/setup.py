@@ -0,0 +1,20 @@
+"""Build script that compiles the optional Cython fast path.
+
+The plugin works without it; when Cython is present at build time the
+header-injection hot path is compiled to a C extension.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        "src/header_injector/_fast.pyx",
+        language_level=3,
+        compiler_directives={"boundscheck": False},
+    )
+except ImportError:
+    ext_modules = []
+
+setup(ext_modules=ext_modules)
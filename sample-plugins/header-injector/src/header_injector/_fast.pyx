@@ -0,0 +1,36 @@
+# cython: language_level=3, boundscheck=False
+"""Optional Cython fast path for the HandleRequest header injection.
+
+Compiled when Cython is available at build time (see setup.py); main.py
+falls back to the pure-Python implementation when this extension is
+missing.
+"""
+
+import sys
+
+from libc.time cimport time as c_time
+
+# Interned so map insertions take the cached-hash fast path.
+_H_REQUEST_TIMESTAMP = sys.intern("X-Request-Timestamp")
+
+
+cdef class FastHeaderInjector:
+    """Compiled hot path: bulk header insert plus per-second timestamp cache."""
+
+    cdef dict _custom_headers
+    cdef long _ts_epoch
+    cdef str _ts_str
+
+    def __init__(self, custom_headers):
+        self._custom_headers = dict(custom_headers)
+        self._ts_epoch = 0
+        self._ts_str = "0"
+
+    cpdef inject(self, headers):
+        """Merge the custom headers and a timestamp into a protobuf headers map."""
+        cdef long now = <long>c_time(NULL)
+        if now != self._ts_epoch:
+            self._ts_epoch = now
+            self._ts_str = str(now)
+        headers.update(self._custom_headers)
+        headers[_H_REQUEST_TIMESTAMP] = self._ts_str